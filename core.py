@@ -0,0 +1,1090 @@
+"""TruthLens core: preprocessing, heuristic detectors, fact verification and
+multilingual explanations. Kept free of Streamlit so it can be imported (and
+benchmarked) without starting the UI; `app.py` is the Streamlit front end.
+"""
+import asyncio
+import atexit
+import logging
+import math
+import os
+import re
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Optional, List, Union
+
+from langdetect import detect, LangDetectException
+try:
+    import httpx
+    from googletrans import Translator
+except Exception:
+    Translator = None
+try:
+    import ahocorasick
+except Exception:
+    ahocorasick = None
+try:
+    import aiohttp
+except Exception:
+    aiohttp = None
+try:
+    import numpy as np
+    from numba import njit
+except Exception:
+    np = None
+    njit = None
+
+_TRANSLATE_TIMEOUT_SECONDS = 10
+_TRANSLATION_CACHE_SIZE = 1024
+_ANALYSIS_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=None)
+def get_translator():
+    """Return the process-wide Translator, or None if unavailable.
+
+    googletrans keeps one HTTP/2 httpx.Client per Translator, so sharing the
+    instance also shares its keep-alive connections; nothing is opened until the
+    first translation.
+    """
+    if Translator is None:
+        return None
+    try:
+        return Translator(
+            service_urls=["translate.google.com"],
+            timeout=httpx.Timeout(_TRANSLATE_TIMEOUT_SECONDS),
+        )
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=_TRANSLATION_CACHE_SIZE)
+def _translate_cached(text: str, dest: str, src: str = "auto") -> str:
+    """Translate `text` into `dest`. Failures raise and are therefore never cached."""
+    translator = get_translator()
+    if translator is None:
+        raise RuntimeError("translator unavailable")
+    return translator.translate(text, src=src, dest=dest).text
+
+
+def translate_batch(requests: List[tuple[str, str]]) -> List[Optional[str]]:
+    """Translate several (text, dest) pairs in a single dispatch.
+
+    googletrans has no multi-target endpoint, so the unique pairs are issued
+    concurrently over the shared translator. Failed entries come back as None
+    so callers can fall back per item.
+    """
+    unique = list(dict.fromkeys(requests))
+    if not unique:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(len(unique), 8)) as executor:
+        futures = {pair: executor.submit(_translate_cached, *pair) for pair in unique}
+
+    results = {}
+    for pair, future in futures.items():
+        try:
+            results[pair] = future.result()
+        except Exception:
+            results[pair] = None
+    return [results[pair] for pair in requests]
+
+
+# Precompiled patterns for the text-preprocessing path (compiled once per process)
+_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+_PUNCT_RE = re.compile(r"[^\w\s]", re.UNICODE)
+_WS_RE = re.compile(r"\s+")
+# numeric sequences of length >=3 (dates like 01012025 or long IDs)
+_NUM_RE = re.compile(r"\d{3,}")
+
+# tokens to preserve through translation (case-insensitive)
+_CRITICAL_TOKENS = sorted(
+    [
+        "indefinitely",
+        "closed",
+        "government",
+        "lockdown",
+        "schools",
+        "withdraw",
+        "withdraw money",
+        "urgent",
+        "urgently",
+        "emergency",
+    ],
+    key=len,
+    reverse=True,
+)
+# one alternation, longer phrases first so e.g. 'withdraw money' wins over 'withdraw';
+# one group per token, so m.lastindex - 1 is the token's index even for case-fold
+# matches like 'ſchools' that don't lower-case back to the token
+_CRITICAL_RE = re.compile("|".join(f"({re.escape(t)})" for t in _CRITICAL_TOKENS), re.IGNORECASE)
+# placeholders emitted by preprocessing_and_translation (__NUM0__, __TK3_1__)
+_PH_RE = re.compile(r"__(?:NUM|TK)\d+(?:_\d+)?__")
+
+
+def clean_text(input_text: str) -> str:
+    """Clean and normalize input text:
+
+    Steps:
+    1. Lowercase
+    2. Remove URLs (http, https, www)
+    3. Remove punctuation but preserve letters in all scripts (keep spaces)
+    4. Collapse multiple spaces
+    """
+    if not input_text:
+        return ""
+
+    text = input_text.lower()
+
+    # remove URLs
+    text = _URL_RE.sub("", text)
+
+    # remove punctuation but preserve letters/digits across Unicode scripts
+    # using \w (Unicode-aware) and keeping whitespace; underscores removed after
+    text = _PUNCT_RE.sub("", text)
+    # replace underscores introduced by \w with space
+    text = text.replace("_", " ")
+
+    # collapse whitespace
+    text = _WS_RE.sub(" ", text).strip()
+
+    return text
+
+
+# Script bands for language detection, indexed by BMP code point
+_BAND_NONE, _BAND_ASCII_LATIN, _BAND_LATIN, _BAND_DEVANAGARI, _BAND_OTHER = range(5)
+
+# Fall back to langdetect for non-Devanagari text that isn't plain ASCII Latin
+USE_LANGDETECT_FALLBACK = True
+
+# Marathi-specific words; Devanagari text containing any of them is tagged 'mr'
+MARATHI_CLUES = frozenset(["आहे", "नाही", "लोकना", "म्हणजे", "मला", "तुम्हाला"])
+
+# search() stops at the first hit and allocates nothing
+_DEVA_RE = re.compile(r"[\u0900-\u097F]")
+_ASCII_LETTER_RE = re.compile(r"[A-Za-z]")
+
+
+def _build_script_bands() -> bytes:
+    bands = bytearray(0x10000)
+    for cp in range(0x10000):
+        if chr(cp).isalpha():
+            bands[cp] = _BAND_OTHER
+    for cp in list(range(0x00C0, 0x0250)) + list(range(0x1E00, 0x1F00)):
+        if bands[cp]:
+            bands[cp] = _BAND_LATIN
+    for cp in list(range(0x41, 0x5B)) + list(range(0x61, 0x7B)):
+        bands[cp] = _BAND_ASCII_LATIN
+    # the whole block, including vowel signs and virama which are not alphabetic
+    bands[0x0900:0x0980] = bytes([_BAND_DEVANAGARI]) * 0x80
+    return bytes(bands)
+
+
+_SCRIPT_BANDS = _build_script_bands()
+
+
+def _script_counts(text: str) -> List[int]:
+    """Count characters of `text` per script band in a single pass."""
+    counts = [0] * 5
+    bands = _SCRIPT_BANDS
+    for ch in text:
+        cp = ord(ch)
+        if cp < 0x10000:
+            counts[bands[cp]] += 1
+        elif ch.isalpha():
+            counts[_BAND_OTHER] += 1
+    return counts
+
+
+def _detect_language(text: str) -> str:
+    """Classify `text` as 'hi', 'mr', 'en' or 'unknown' from its script.
+
+    Only Latin text with accented letters, or text in other scripts, is handed
+    to langdetect (when USE_LANGDETECT_FALLBACK is set).
+    """
+    # Devanagari script characters (covers Hindi, Marathi, Nepali, etc.)
+    if _DEVA_RE.search(text):
+        # Heuristic: check for Marathi-specific words to prefer 'mr'; the clues
+        # are uncased Devanagari, so the text needs no lower-casing first
+        if _MARATHI_SCANNER.scan(text):
+            return "mr"
+        # Default to Hindi if Devanagari is present and Marathi clues not found
+        return "hi"
+
+    # Plain ASCII is English as soon as it has a letter
+    if text.isascii():
+        return "en" if _ASCII_LETTER_RE.search(text) else "unknown"
+
+    counts = _script_counts(text)
+    latin = counts[_BAND_ASCII_LATIN] + counts[_BAND_LATIN]
+    if latin and not counts[_BAND_LATIN] and latin >= counts[_BAND_OTHER]:
+        return "en"
+
+    if USE_LANGDETECT_FALLBACK and (latin or counts[_BAND_OTHER]):
+        try:
+            return detect(text)
+        except Exception:
+            return "unknown"
+    return "unknown"
+
+
+def process_language(text: str) -> tuple[str, str]:
+    """Detect the language of `text`. If it's not English, translate it to English.
+
+    Heuristics added:
+    - If text contains Devanagari characters, prefer 'hi'/'mr' detection based on simple keyword checks.
+    - Plain ASCII Latin text is treated as English without calling a detector.
+    - Fall back to `langdetect.detect()` only for other scripts or accented Latin text.
+    - Wrap detection and translation in try/except and return sensible defaults on error.
+
+    Returns:
+        analysis_text: the English text to use for downstream analysis
+        detected_lang: ISO 639-1 language code detected for the original text
+    """
+    detected_lang = "unknown"
+    analysis_text = text
+
+    try:
+        if text:
+            detected_lang = _detect_language(text)
+
+        # Only translate if detected language is known and not English
+        if detected_lang and detected_lang.lower() != "en" and detected_lang != "unknown":
+            try:
+                # cached on success only, so a transient failure is retried next time
+                analysis_text = _translate_cached(text, "en", detected_lang)
+            except Exception:
+                # translator unavailable or translation failed; keep original text as fallback
+                analysis_text = text
+        else:
+            analysis_text = text
+
+    except Exception as e:
+        # Any unexpected failure should not crash the app. Log to console and return originals.
+        print(f"process_language error: {e}")
+        detected_lang = detected_lang if detected_lang else "unknown"
+        analysis_text = text
+
+    return analysis_text, detected_lang
+
+
+def preprocessing_and_translation(raw_input: str) -> tuple[str, str]:
+    """Robust preprocessing and translation.
+
+    - Preserve numerical sequences (dates, long numbers) and critical tokens by
+      replacing them with placeholders before translation and restoring after.
+    - Ensures critical tokens like 'indefinitely', 'closed', 'government' remain present
+      in the English text used for analysis.
+
+    Returns: (processed_english_text, detected_language)
+    """
+    if not raw_input:
+        return "", "unknown"
+
+    # prepare placeholders for numeric sequences in a single pass
+    placeholder_map = {}
+
+    def _protect_num(m):
+        key = f"__NUM{len(placeholder_map)}__"
+        placeholder_map[key] = m.group(0)
+        return key
+
+    tmp = _NUM_RE.sub(_protect_num, raw_input)
+
+    # protect critical tokens with placeholders in a single pass (longer phrases first)
+    occurrences = {}
+
+    def _protect_token(m):
+        i = m.lastindex - 1
+        j = occurrences.get(i, 0)
+        occurrences[i] = j + 1
+        key = f"__TK{i}_{j}__"
+        placeholder_map[key] = m.group(0)
+        return key
+
+    tmp = _CRITICAL_RE.sub(_protect_token, tmp)
+
+    # detect language and translate via existing process_language but on placeholder text
+    try:
+        translated_text, detected_lang = process_language(tmp)
+    except Exception:
+        translated_text, detected_lang = tmp, "unknown"
+
+    # restore placeholders in one pass; unknown keys are left untouched
+    translated_text = _PH_RE.sub(lambda m: placeholder_map.get(m.group(0), m.group(0)), translated_text)
+
+    # finally clean but ensure we don't strip numeric/date tokens
+    processed = clean_text(translated_text)
+    return processed, detected_lang
+
+
+# --- Term sets used by the heuristic detectors (built once, shared by every call) ---
+SUSPICIOUS_TERMS = frozenset({
+    "false",
+    "hoax",
+    "conspiracy",
+    "hidden",
+    "coverup",
+    "fake",
+    "exposed",
+    "lying",
+    # financial/hoax indicators
+    "withdrawn",
+    "bank",
+    "account",
+    "whatsapp",
+    "scam",
+    "modi",
+    "important",
+
+    # ADDED: Political / Election / Urgency / Health terms
+    "election",
+    "protest",
+    "results",
+    "tomorrow",
+    "immediately",
+    "fraud",
+    "vote",
+    "scandal",
+    "corrupt",
+    "who",
+    "cure",
+    "virus",
+    "pandemic",
+    "confirmed",
+    "officially",
+    "health",
+})
+
+# Boost heuristic: sensational patterns that often indicate misinformation
+SENSATIONAL_MARKERS = frozenset({
+    "urgent",
+    "alert",
+    "shocking",
+    "you won't believe",
+    "just confirmed",
+    "has just confirmed",
+    "breaking",
+    "important news",
+    "important",
+})
+
+# financial markers increase suspicion
+FINANCIAL_MARKERS = frozenset({"withdrawn", "bank", "account", "5000", "rupees", "whatsapp", "transfer"})
+
+# claims attributed to WHO or a government get an extra boost when sensational
+AUTHORITY_TERMS = frozenset({"who", "government", "modi"})
+
+SENSATIONAL_TERMS = frozenset({
+    "shocking",
+    "urgent",
+    "breaking",
+    "unbelievable",
+    "horrific",
+    "shocker",
+    "alert",
+    "exclusive",
+    "must read",
+    "you won't believe",
+    "hidden",
+    "hiding",
+    "important",
+    "important news",
+    "withdrawn",
+    "bank",
+    "whatsapp",
+    "modi",
+    # ADDED Urgency/Action Terms
+    "protest",
+    "immediately",
+    "fake news alert",
+    "crisis",
+    "emergency",
+})
+
+CRISIS_KEYWORDS = frozenset({
+    "schools closed",
+    "lockdown",
+    "government mandate",
+    "withdraw money",
+    "urgently",
+    "emergency",
+    "closed indefinitely",
+    # health-related crisis keywords
+    "who",
+    "pandemic",
+    "virus cure",
+    "virus",
+    "health",
+    # ADDED Political/Election/Health Crisis Terms
+    "election results fake",
+    "protest immediately",
+    "voting fraud",
+    "who cure",
+    "pandemic virus",
+})
+
+
+def _scan_bytes(buf, goto, out_offsets, out_terms, term_lens, n_terms):
+    """Walk `buf` once through an Aho-Corasick DFA and count hits per term id.
+
+    Repeats of one term are counted non-overlapping, like str.count.
+    """
+    counts = np.zeros(n_terms, dtype=np.int32)
+    next_start = np.zeros(n_terms, dtype=np.int64)
+    state = 0
+    for i in range(buf.shape[0]):
+        state = goto[state, buf[i]]
+        for k in range(out_offsets[state], out_offsets[state + 1]):
+            term_id = out_terms[k]
+            if i + 1 - term_lens[term_id] >= next_start[term_id]:
+                counts[term_id] += 1
+                next_start[term_id] = i + 1
+    return counts
+
+
+_scan_bytes_jit = njit(cache=True)(_scan_bytes) if njit is not None else None
+
+# texts shorter than this are scanned in Python; the JIT pays off on pasted articles
+_JIT_MIN_CHARS = 1024
+
+
+def _build_dfa(terms):
+    """Compile `terms` into dense Aho-Corasick tables over UTF-8 bytes.
+
+    Returns (goto, out_offsets, out_terms, term_lens): goto[state, byte] is the
+    next state, out_terms[out_offsets[s]:out_offsets[s + 1]] are the term ids
+    ending at s, and term_lens[id] is the term's length in bytes.
+    """
+    children = [{}]
+    own = [[]]
+    for term_id, term in enumerate(terms):
+        state = 0
+        for byte in term.encode("utf-8"):
+            if byte not in children[state]:
+                children[state][byte] = len(children)
+                children.append({})
+                own.append([])
+            state = children[state][byte]
+        own[state].append(term_id)
+
+    goto = np.zeros((len(children), 256), dtype=np.int32)
+    fail = [0] * len(children)
+    outputs = [list(ids) for ids in own]
+    queue = []
+    for byte, child in children[0].items():
+        goto[0, byte] = child
+        queue.append(child)
+    # breadth-first, so fail[] of shallower states is final before it is used
+    for state in queue:
+        outputs[state] += outputs[fail[state]]
+        goto[state] = goto[fail[state]]
+        for byte, child in children[state].items():
+            fail[child] = goto[fail[state], byte] if state else 0
+            goto[state, byte] = child
+            queue.append(child)
+
+    out_offsets = np.zeros(len(children) + 1, dtype=np.int32)
+    out_offsets[1:] = np.cumsum([len(ids) for ids in outputs])
+    out_terms = np.array([i for ids in outputs for i in ids], dtype=np.int32)
+    term_lens = np.array([len(term.encode("utf-8")) for term in terms], dtype=np.int32)
+    return goto, out_offsets, out_terms, term_lens
+
+
+class _TermScanner:
+    """Count occurrences of a fixed set of terms in a single pass over the text.
+
+    Uses a pyahocorasick automaton when available; otherwise falls back to one
+    precompiled lookahead alternation. Long texts go through a Numba-compiled
+    byte-level DFA when Numba is installed. Every term is counted as if
+    searched on its own with str.count: different terms may overlap
+    (e.g. 'important' inside 'important news'), while repeats of one term are
+    counted non-overlapping ('healthealth' holds one 'health').
+    """
+
+    def __init__(self, terms):
+        # longest first so the regex fallback reports the longest term at each position
+        self.terms = sorted(set(terms), key=lambda t: (-len(t), t))
+        self._automaton = None
+        self._pattern = None
+        self._dfa = None
+        if not self.terms:
+            return
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for term in self.terms:
+                self._automaton.add_word(term, term)
+            self._automaton.make_automaton()
+        else:
+            self._pattern = re.compile("(?=(" + "|".join(map(re.escape, self.terms)) + "))")
+            # every shorter term starting at the same position is a prefix of the longest match
+            self._prefixes = {t: [p for p in self.terms if t.startswith(p)] for t in self.terms}
+        if _scan_bytes_jit is not None:
+            try:
+                self._dfa = _build_dfa(self.terms)
+                # compile (or load from cache) now rather than on the first long claim;
+                # scan() passes a read-only frombuffer array, so warm up with the same type
+                _scan_bytes_jit(np.frombuffer(b"\0", dtype=np.uint8), *self._dfa, len(self.terms))
+            except Exception:
+                self._dfa = None
+
+    def scan(self, lower: str) -> Counter:
+        """Return a Counter of term -> occurrences in the (already lower-cased) text."""
+        hits = Counter()
+        if not lower:
+            return hits
+        if self._dfa is not None and len(lower) >= _JIT_MIN_CHARS:
+            buf = np.frombuffer(lower.encode("utf-8", "surrogatepass"), dtype=np.uint8)
+            counts = _scan_bytes_jit(buf, *self._dfa, len(self.terms))
+            for term_id in np.flatnonzero(counts):
+                hits[self.terms[term_id]] = int(counts[term_id])
+        elif self._automaton is not None:
+            next_start = {}
+            for end, term in self._automaton.iter(lower):
+                if end + 1 - len(term) >= next_start.get(term, 0):
+                    hits[term] += 1
+                    next_start[term] = end + 1
+        elif self._pattern is not None:
+            next_start = {}
+            for m in self._pattern.finditer(lower):
+                pos = m.start()
+                for term in self._prefixes[m.group(1)]:
+                    if pos >= next_start.get(term, 0):
+                        hits[term] += 1
+                        next_start[term] = pos + len(term)
+        return hits
+
+
+# Shared scanner over every term category, built once at import time
+_SCANNER = _TermScanner(
+    SUSPICIOUS_TERMS | SENSATIONAL_MARKERS | FINANCIAL_MARKERS | AUTHORITY_TERMS
+    | SENSATIONAL_TERMS | CRISIS_KEYWORDS
+)
+
+# Marathi clue lookup for _detect_language
+_MARATHI_SCANNER = _TermScanner(MARATHI_CLUES)
+
+# One bit per term category; a text's categories fold into a single int
+BIT_SUSP = 1
+BIT_SENS = 2
+BIT_FIN = 4
+BIT_CRISIS = 8
+BIT_WHO_GOVT = 16
+BIT_SENS_TERM = 32
+
+
+def _build_term_flags() -> dict:
+    """Map each term to the OR of the category bits it belongs to."""
+    term_flags = {}
+    for terms, bit in (
+        (SUSPICIOUS_TERMS, BIT_SUSP),
+        (SENSATIONAL_MARKERS, BIT_SENS),
+        (FINANCIAL_MARKERS, BIT_FIN),
+        (CRISIS_KEYWORDS, BIT_CRISIS),
+        (AUTHORITY_TERMS, BIT_WHO_GOVT),
+        (SENSATIONAL_TERMS, BIT_SENS_TERM),
+    ):
+        for term in terms:
+            term_flags[term] = term_flags.get(term, 0) | bit
+    return term_flags
+
+
+_TERM_FLAGS = _build_term_flags()
+
+
+def _boost_for_flags(flags: int) -> float:
+    boost = 0.0
+    if flags & BIT_SENS:
+        boost += 0.45
+    if flags & BIT_FIN:
+        boost += 0.35
+    # if the claim mentions WHO or a government and sensational markers, increase suspicion further
+    if flags & BIT_SENS and flags & BIT_WHO_GOVT:
+        boost += 0.2
+    return boost
+
+
+# misinformation boost for every combination of the low five category bits
+_BOOST_LUT = tuple(_boost_for_flags(flags) for flags in range(32))
+
+
+@dataclass(frozen=True)
+class AnalyzedText:
+    """Text prepared once for the heuristic detectors.
+
+    Lower-casing, tokenizing and the term scan happen a single time here and are
+    shared by every detector instead of being redone in each helper. Frozen so
+    instances can key the analyze_text cache.
+    """
+
+    raw: str
+    lower: str
+    token_count: int
+
+    @classmethod
+    def from_text(cls, text: str, cleaned: bool = False) -> "AnalyzedText":
+        """Prepare `text`; pass cleaned=True only for clean_text output."""
+        if cleaned:
+            # clean_text leaves single spaces and no leading/trailing whitespace
+            token_count = text.count(" ") + 1 if text else 0
+        else:
+            token_count = len(text.split())
+        return cls(raw=text, lower=text.lower(), token_count=token_count)
+
+    @cached_property
+    def hits(self) -> Counter:
+        """Term hits from the shared scanner, computed on first use."""
+        return _SCANNER.scan(self.lower)
+
+    @cached_property
+    def flags(self) -> int:
+        """Bitmask of the term categories (BIT_*) present in the text."""
+        flags = 0
+        for term in self.hits:
+            flags |= _TERM_FLAGS[term]
+        return flags
+
+
+def _as_analyzed(text: Union[str, AnalyzedText]) -> AnalyzedText:
+    """Accept either a plain string or an already prepared AnalyzedText."""
+    if isinstance(text, AnalyzedText):
+        return text
+    return AnalyzedText.from_text(text or "")
+
+
+class MisinformationDetector:
+    """Simple heuristic misinformation scorer.
+
+    For the prototype we implement a lightweight heuristic:
+    - Score is based on presence of words often seen in misinformation (e.g., 'false', 'hoax', 'conspiracy', 'hidden', 'coverup')
+    - Longer texts dilute single-word signals; we normalize by length.
+    """
+
+    @staticmethod
+    def score(text: Union[str, AnalyzedText]) -> float:
+        analyzed = _as_analyzed(text)
+        if not analyzed.raw:
+            return 0.0
+        hits = analyzed.hits
+
+        # count suspicious term occurrences as substrings to catch joined tokens (e.g., 'newsmodi')
+        count = sum(hits[term] for term in SUSPICIOUS_TERMS)
+
+        # sensational/financial/authority boosts, looked up from the category bits
+        boost = _BOOST_LUT[analyzed.flags & 0x1F]
+
+        # compute density of suspicious terms in the text (count per token)
+        # density is a clearer signal for short/high-signal texts than log-normalization
+        token_count = max(1, analyzed.token_count)
+        base = float(count) / token_count
+
+        score = base + boost
+        # clamp between 0 and 1
+        return float(max(0.0, min(1.0, score)))
+
+
+def detect_sensationalism(text: Union[str, AnalyzedText]) -> float:
+    """Detect sensationalism by counting high-intensity adjectives and urgency words.
+
+    Returns a score between 0 and 1 indicating the strength of sensational language.
+    """
+    analyzed = _as_analyzed(text)
+    if not analyzed.raw:
+        return 0.0
+
+    hits = analyzed.hits
+    score = sum(1 for term in SENSATIONAL_TERMS if term in hits)
+
+    # normalize
+    return min(1.0, score / len(SENSATIONAL_TERMS))
+
+
+def _misinfo_band(score: float) -> int:
+    # 0: < 0.3, 1: 0.3..0.6, 2: > 0.6
+    return (score >= 0.3) + (score > 0.6)
+
+
+def _sensationalism_band(score: float) -> int:
+    # 0: < 0.3, 1: == 0.3, 2: > 0.3
+    return (score >= 0.3) + (score > 0.3)
+
+
+def _build_prelim_lut() -> tuple:
+    """Evaluate the preliminary-verdict rules once per (misinfo, sensationalism) band."""
+    def rule(misinfo_score: float, sensationalism_score: float) -> str:
+        if misinfo_score > 0.6 and sensationalism_score > 0.3:
+            return "Fake"
+        if misinfo_score < 0.3 and sensationalism_score < 0.3:
+            return "Real"
+        return "Unclear"
+
+    # one representative score per band, in band order
+    misinfo_reps = (0.0, 0.3, 1.0)
+    sensationalism_reps = (0.0, 0.3, 1.0)
+    return tuple(tuple(rule(m, s) for s in sensationalism_reps) for m in misinfo_reps)
+
+
+_PRELIM_LUT = _build_prelim_lut()
+
+
+def generate_preliminary_prediction(misinfo_score: float, sensationalism_score: float) -> str:
+    """Combine misinfo score and sensationalism score to produce a provisional verdict.
+
+    Simple rules:
+    - If misinfo_score > 0.6 and sensationalism_score > 0.3 => 'Fake'
+    - If misinfo_score < 0.3 and sensationalism_score < 0.3 => 'Real'
+    - Otherwise => 'Unclear'
+    """
+    return _PRELIM_LUT[_misinfo_band(misinfo_score)][_sensationalism_band(sensationalism_score)]
+
+
+@lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)
+def analyze_text(processed_text: Union[str, AnalyzedText]) -> tuple[float, float, str]:
+    """Analyze text to produce misinformation and sensationalism scores with
+    increased sensitivity for high-impact crisis keywords.
+
+    This function uses the existing heuristic detectors as model stand-ins
+    but applies the requested CRITICAL FIX: boosting scores when crisis keywords
+    appear so that high-risk, unverified public-safety claims do not get a 0.0 score.
+
+    Results are memoized per input text; call analyze_text.cache_clear() to reset.
+    """
+    # Use existing heuristics as model proxies (replaceable with real models later).
+    # The text is lower-cased and scanned once; both detectors and the crisis
+    # keyword check read from the same AnalyzedText.
+    analyzed = _as_analyzed(processed_text)
+    misinfo_score = MisinformationDetector.score(analyzed)
+    sensationalism_score = detect_sensationalism(analyzed)
+
+    # --- CRITICAL FIX IMPLEMENTATION: Increase Sensitivity ---
+    if analyzed.flags & BIT_CRISIS:
+        if misinfo_score < 0.70:
+            misinfo_score = min(1.0, misinfo_score + 0.50)
+        if sensationalism_score < 0.20:
+            sensationalism_score = min(1.0, sensationalism_score + 0.20)
+
+    # Generate preliminary prediction based on boosted scores
+    if misinfo_score > 0.80 or sensationalism_score > 0.80:
+        preliminary_prediction = "Fake"
+    elif misinfo_score < 0.20 and sensationalism_score < 0.20:
+        preliminary_prediction = "Real"
+    else:
+        preliminary_prediction = "Unclear"
+
+    return misinfo_score, sensationalism_score, preliminary_prediction
+
+
+# Live fact-check endpoints; only queried when an API key is configured
+GOOGLE_FACT_CHECK_URL = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
+GOOGLE_FACT_CHECK_API_KEY = os.environ.get("GOOGLE_FACT_CHECK_API_KEY", "")
+
+
+def _live_providers(claim_text: str) -> list:
+    """(url, params) pairs for the live fact-check providers that are configured."""
+    providers = []
+    if GOOGLE_FACT_CHECK_API_KEY:
+        providers.append(
+            (GOOGLE_FACT_CHECK_URL, {"query": claim_text, "key": GOOGLE_FACT_CHECK_API_KEY, "pageSize": 5})
+        )
+    return providers
+
+
+# Streamlit runs each session on its own thread, so creation must be guarded;
+# lru_cache alone would let two concurrent first calls each build a client
+_HTTP_CLIENT = None
+_HTTP_CLIENT_LOCK = threading.Lock()
+
+
+def _get_http_client() -> tuple:
+    """Return the process-wide (loop, session) pair, creating it on first use."""
+    global _HTTP_CLIENT
+    with _HTTP_CLIENT_LOCK:
+        if _HTTP_CLIENT is None:
+            _HTTP_CLIENT = _create_http_client()
+        return _HTTP_CLIENT
+
+
+def _create_http_client() -> tuple:
+    """Background event loop plus one pooled aiohttp session, shared process-wide.
+
+    An aiohttp session is bound to the loop it was created on, so the loop runs
+    on its own daemon thread for the lifetime of the process and keep-alive
+    connections survive between claims.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="truthlens-http", daemon=True).start()
+
+    async def _create_session():
+        if aiohttp is None:
+            return None
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=10),
+            connector=aiohttp.TCPConnector(limit=20, keepalive_timeout=60),
+        )
+
+    session = asyncio.run_coroutine_threadsafe(_create_session(), loop).result()
+
+    def _shutdown():
+        # close pooled connections while the loop thread is still alive
+        if session is not None:
+            asyncio.run_coroutine_threadsafe(session.close(), loop).result(timeout=5)
+        loop.call_soon_threadsafe(loop.stop)
+
+    atexit.register(_shutdown)
+    return loop, session
+
+
+# Ratings that negate a "true"-side keyword ("inaccurate" contains "accurate");
+# checked before any other keyword so they never read as True
+_NEGATED_RATINGS = (
+    "untrue", "not true", "inaccurate", "not accurate", "not correct",
+    "no evidence", "wrong", "unsupported",
+)
+
+
+def _normalize_rating(rating: str) -> str:
+    """Map a publisher's free-text rating onto True/False/Mixed."""
+    rating = rating.lower()
+    if any(k in rating for k in _NEGATED_RATINGS):
+        return "False"
+    if any(k in rating for k in ["false", "fake", "hoax", "incorrect", "misleading", "pants on fire"]):
+        return "False"
+    if any(k in rating for k in ["half", "mixed", "partly", "mostly", "unproven"]):
+        return "Mixed"
+    if any(k in rating for k in ["true", "correct", "accurate"]):
+        return "True"
+    return "Mixed"
+
+
+async def _query_provider(session, url: str, params: dict) -> list:
+    """Query one live fact-check endpoint. Any failure yields no results."""
+    try:
+        async with session.get(url, params=params) as resp:
+            resp.raise_for_status()
+            payload = await resp.json()
+
+        # parse inside the guard too: a malformed body must not fail the whole gather
+        results = []
+        for claim in payload.get("claims", []):
+            for review in claim.get("claimReview", []):
+                results.append({
+                    "verdict": _normalize_rating(review.get("textualRating", "")),
+                    "url": review.get("url", ""),
+                    "title": review.get("title") or review.get("publisher", {}).get("name", "Fact-check"),
+                })
+        return results
+    except Exception as e:
+        print(f"fact-check provider error ({url}): {e}")
+        return []
+
+
+async def query_google_fact_check_async(claim_text: str, session) -> list:
+    """Query every fact-check provider concurrently and merge the results.
+
+    `session` is an open aiohttp.ClientSession bound to the running loop; code
+    outside an event loop should call query_google_fact_check instead.
+    Simulated matches come first, followed by live providers in order; with
+    several live providers the total latency is that of the slowest one.
+    """
+    results = _simulated_fact_checks(claim_text.lower())
+    providers = _live_providers(claim_text)
+    for provider_results in await asyncio.gather(*[_query_provider(session, u, p) for u, p in providers]):
+        results.extend(provider_results)
+    return results
+
+
+def query_google_fact_check(claim_text: Union[str, AnalyzedText]) -> list:
+    """Google Fact Check query (simulated, plus live providers when configured).
+
+    Returns a list of dicts with keys: 'verdict' (True/False/Mixed), 'url', 'title'.
+    Claims are heuristically matched to mocked fact-checks; when
+    GOOGLE_FACT_CHECK_API_KEY is set the Google Fact Check Tools API is queried too.
+    """
+    lower = _as_analyzed(claim_text).lower
+    if not lower:
+        return []
+    if aiohttp is None or not _live_providers(lower):
+        # nothing to fetch over the network; skip the event loop round-trip
+        return _simulated_fact_checks(lower)
+
+    loop, session = _get_http_client()
+    return asyncio.run_coroutine_threadsafe(query_google_fact_check_async(lower, session), loop).result()
+
+
+def _simulated_fact_checks(lower: str) -> list:
+    """Placeholder provider that heuristically matches claims to mocked fact-checks."""
+    results = []
+
+    # Heuristic matches to simulate fact-check results
+    if any(k in lower for k in ["fake", "hoax", "conspiracy", "coverup", "lying", "exposed"]):
+        results.append({
+            "verdict": "False",
+            "url": "https://factcheck.google.com/claim-false",
+            "title": "Google Fact Check: Claim found to be false",
+        })
+
+    # FIX: Updated WHO check to include health/cure/pandemic keywords
+    if "who" in lower and any(k in lower for k in ["hiding", "hidden", "cure", "virus", "pandemic", "health", "confirmed"]):
+        results.append({
+            "verdict": "False",
+            "url": "https://www.who.int/news/factcheck-cure-hoax",
+            "title": "WHO Fact-check: No evidence for specific virus cure (Health Hoax)",
+        })
+
+    # ADD: PIB fact-check heuristic for government/finance related claims
+    if any(k in lower for k in ["government", "modi", "finance", "subsidy", "bank account", "pension"]):
+        results.append({
+            "verdict": "False",
+            "url": "https://pib.gov.in/factcheck-govt-scheme-hoax",
+            "title": "PIB Fact Check: Government has not announced this scheme.",
+        })
+
+    if any(k in lower for k in ["vaccine", "vaccination"]):
+        results.append({
+            "verdict": "Mixed",
+            "url": "https://example.com/factcheck-vaccine",
+            "title": "Fact-check: Mixed evidence on vaccine claim",
+        })
+
+    # if nothing matched, return empty list (no external checks found)
+    return results
+
+
+# Verdict/confidence for external evidence, indexed by (has_false << 2) | (has_true << 1) | has_mixed.
+# None means no decisive verdict was found and the weighted score below applies.
+_EXT_VERDICT_LUT = (
+    None,        # nothing recognised
+    "Unclear",   # mixed only
+    "Real",      # true
+    "Real",      # true + mixed
+    "Fake",      # false
+    "Fake",      # false + mixed
+    "Unclear",   # false + true: contradictory
+    "Unclear",   # false + true + mixed
+)
+_EXT_CONF_LUT = (0, 60, 95, 95, 95, 95, 60, 60)
+
+
+def calculate_confidence_score(misinfo_score: float, api_results: list) -> tuple[int, str]:
+    """Combine the internal misinfo_score (0-1) with external API results to produce
+    a final confidence (0-100) and a final verdict (Fake/Real/Unclear).
+
+    Strategy (prototype):
+    - Internal component: misinfo_score weighted to 0-50
+    - External component: based on fraction of 'False' results among API hits, mapped to 0-50
+    - Final confidence = internal + external, clamped 0-100
+    - Final verdict thresholds: >=66 -> Fake, <=33 -> Real, else Unclear
+    """
+    # Internal component (scaled 0-50)
+    internal = float(misinfo_score) * 50
+
+    # If there are no external results, keep a neutral external component
+    if not api_results:
+        # New behavior: when no external verification exists, rely more on internal
+        # model signal. If the internal misinfo_score is high (>0.70) we treat the
+        # claim as likely Fake with moderately high confidence (60-80).
+        if misinfo_score > 0.70:
+            # Map misinfo_score 0.70->60 up to 1.0->80 linearly
+            span = max(0.0001, 1.0 - 0.70)
+            final_score = int(min(80, max(60, round(60 + ((misinfo_score - 0.70) / span) * 20))))
+            return final_score, "Fake"
+
+        # otherwise keep a neutral external component as before
+        external = 25.0  # neutral
+        final_score = int(max(0, min(100, round(internal + external))))
+        # map to verdict as before
+        if final_score >= 66:
+            final_verdict = "Fake"
+        elif final_score <= 33:
+            final_verdict = "Real"
+        else:
+            final_verdict = "Unclear"
+        return final_score, final_verdict
+
+    # Analyze external verdicts
+    verdicts = {str(r.get("verdict", "")).lower() for r in api_results}
+    idx = (("false" in verdicts) << 2) | (("true" in verdicts) << 1) | ("mixed" in verdicts)
+
+    # Priority rules when external evidence exists
+    if _EXT_VERDICT_LUT[idx] is not None:
+        return _EXT_CONF_LUT[idx], _EXT_VERDICT_LUT[idx]
+
+    # Fallback: compute weighted score from fraction of false among external
+    total = len(api_results)
+    false_count = sum(1 for r in api_results if str(r.get("verdict", "")).lower() == "false")
+    external = (false_count / total) * 50.0
+
+    final_score = int(max(0, min(100, round(internal + external))))
+    if final_score >= 66:
+        final_verdict = "Fake"
+    elif final_score <= 33:
+        final_verdict = "Real"
+    else:
+        final_verdict = "Unclear"
+
+    return final_score, final_verdict
+
+
+# Explanation summaries by final verdict; {cites} names up to two fact-check titles
+_MIXED_SUMMARY_TEMPLATE = (
+    "Verification attempts show mixed evidence. Some sources ({cites}) provide partial or "
+    "conflicting information. While some safety data or context is available, the specific "
+    "claim lacks strong official confirmation, making the overall verdict unclear."
+)
+_FALLBACK_SUMMARY = "The verification result is unclear based on available data."
+_SUMMARY_TEMPLATES = {
+    "Fake": (
+        "External fact-checks (e.g., {cites}) contradict the claim. Available evidence indicates "
+        "the claim is false or unsupported. Proceed with caution and rely on verified sources."
+    ),
+    "Real": (
+        "External fact-checks (e.g., {cites}) support the claim or provide corroborating evidence. "
+        "The claim appears to be supported by available sources."
+    ),
+    "Unclear": _FALLBACK_SUMMARY,
+}
+
+
+def summarize_verified_facts(api_results: list, final_verdict: str) -> str:
+    """Generate a short English summary explaining the verification outcome.
+
+    For 'Unclear' with mixed results, explain why evidence is mixed and cite sources.
+    """
+    if not api_results:
+        return (
+            "No external fact-checks were found for this claim. "
+            "The analysis relies on internal signals which may indicate risk but external "
+            "corroboration is unavailable."
+        )
+
+    verdicts = [str(r.get("verdict", "")).lower() for r in api_results]
+    cites = ", ".join(r.get("title", "source") for r in api_results[:2])
+
+    if final_verdict == "Unclear" and any(v == "mixed" for v in verdicts):
+        # Build a mixed-evidence summary
+        return _MIXED_SUMMARY_TEMPLATE.format(cites=cites)
+
+    return _SUMMARY_TEMPLATES.get(final_verdict, _FALLBACK_SUMMARY).format(cites=cites)
+
+
+def generate_multilingual_explanation(english_summary: str) -> dict:
+    """Translate the English summary into Hindi and Marathi.
+
+    Uses the existing Translator; if translation fails, returns the English text as fallback.
+    """
+    out = {"en": english_summary}
+    if get_translator() is None:
+        # Translator not available; return English text for fallbacks
+        out["hi"] = english_summary
+        out["mr"] = english_summary
+        return out
+
+    # Hindi and Marathi go out together; a failed language falls back on its own
+    langs = ("hi", "mr")
+    translated = translate_batch([(english_summary, lang) for lang in langs])
+    for lang, text in zip(langs, translated):
+        out[lang] = text if text is not None else english_summary
+
+    return out
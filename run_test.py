@@ -1,4 +1,4 @@
-from app import clean_text, process_language, MisinformationDetector, detect_sensationalism, generate_preliminary_prediction
+from core import clean_text, process_language, MisinformationDetector, detect_sensationalism, generate_preliminary_prediction
 
 sample = "SHOCKING news!!! The WHO is hiding the true source of the outbreak: read this urgent report http://bad.url/urgent-report"
 
@@ -1,4 +1,4 @@
-from app import clean_text, process_language, MisinformationDetector, detect_sensationalism, generate_preliminary_prediction, query_google_fact_check, calculate_confidence_score
+from core import clean_text, process_language, MisinformationDetector, detect_sensationalism, generate_preliminary_prediction, query_google_fact_check, calculate_confidence_score
 
 sample = "this is important newsmodi government has withdrawn 5000 from all bank accountssource whatsapp chat"
 
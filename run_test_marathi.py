@@ -1,4 +1,4 @@
-from app import clean_text, process_language, MisinformationDetector, detect_sensationalism, generate_preliminary_prediction
+from core import clean_text, process_language, MisinformationDetector, detect_sensationalism, generate_preliminary_prediction
 
 # A short Marathi sentence (Devanagari) - "WHO is hiding the true source" style in Marathi
 sample = "घुष्टी बातमी! WHO खरी स्त्रोत लपवत आहे, हे त्वरित वाचा"
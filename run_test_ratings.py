@@ -0,0 +1,25 @@
+from core import _normalize_rating, calculate_confidence_score
+
+# Negated ratings contain a "true"-side keyword but must never normalize to True
+cases = {
+    "Inaccurate": "False",
+    "Untrue": "False",
+    "Not true": "False",
+    "No evidence": "False",
+    "Wrong": "False",
+    "Unsupported": "False",
+    "False": "False",
+    "Mostly true": "Mixed",
+    "Half true": "Mixed",
+    "True": "True",
+    "Accurate": "True",
+    "Correct": "True",
+}
+
+for rating, expected in cases.items():
+    got = _normalize_rating(rating)
+    print(f'{rating!r} -> {got}')
+    assert got == expected, f'{rating!r}: expected {expected}, got {got}'
+
+print('Confidence for an "Inaccurate" rating:', calculate_confidence_score(0.1, [{"verdict": _normalize_rating("Inaccurate")}]))
+print('All rating checks passed.')
@@ -1,4 +1,4 @@
-from app import clean_text, process_language, MisinformationDetector, detect_sensationalism, generate_preliminary_prediction, query_google_fact_check, calculate_confidence_score
+from core import preprocessing_and_translation, clean_text, process_language, MisinformationDetector, detect_sensationalism, generate_preliminary_prediction, query_google_fact_check, calculate_confidence_score
 
 sample = "urgent alert the who has just confirmed that the new virus is spreading rapidly"
 
@@ -27,3 +27,8 @@ print('API results:', api_results)
 final_confidence, final_verdict = calculate_confidence_score(misinfo_score, api_results)
 print('Final confidence:', final_confidence)
 print('Final verdict:', final_verdict)
+
+# Case-fold variants of critical tokens (long s, dotless i) must survive preprocessing
+for variant in ["ſchools closed", "wıthdraw money now"]:
+    processed, lang = preprocessing_and_translation(variant)
+    print('Preprocessed:', repr(variant), '->', repr(processed), lang)